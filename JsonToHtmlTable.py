@@ -1,7 +1,36 @@
 import json
 import html
+import string
 from typing import List, Dict, Any, Optional
 
+# Fixed page skeleton; only the placeholders change between renders
+_DOC_TEMPLATE = string.Template("""
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Beautiful Data Table</title>
+            $css
+        </head>
+        <body>
+        $title_block
+        <div class="table-container">
+            <table class="beautiful-table">
+                <thead>
+                    <tr>
+        $header_cells
+                    </tr>
+                </thead>
+                <tbody>
+        $rows
+                </tbody>
+            </table>
+        </div>
+        </body>
+        </html>
+        """)
+
 
 class BeautifulTableGenerator:
     def __init__(self,
@@ -29,11 +58,29 @@ class BeautifulTableGenerator:
         self.border_color = border_color
         self.hover_color = hover_color
 
+        # CSS only depends on the colors above, so build it once and reuse it
+        # across renders (rebuilt lazily if a color is changed afterwards).
+        self._css_key = None
+        self._css = ""
+
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
-        return html.escape(str(text))
+        return html.escape(text if type(text) is str else str(text))
+
+    def _color_key(self) -> tuple:
+        """Tuple of the current colors, used to validate the cached CSS."""
+        return (self.header_color, self.header_text_color, self.even_row_color,
+                self.odd_row_color, self.border_color, self.hover_color)
 
     def _generate_css(self) -> str:
+        """Return the CSS styles for the table, cached per color scheme."""
+        key = self._color_key()
+        if key != self._css_key:
+            self._css = self._build_css()
+            self._css_key = key
+        return self._css
+
+    def _build_css(self) -> str:
         """Generate CSS styles for the table."""
         return f"""
         <style>
@@ -108,7 +155,8 @@ class BeautifulTableGenerator:
     def json_to_html_table(self,
                            json_data: List[Dict[str, Any]],
                            title: Optional[str] = None,
-                           custom_headers: Optional[List[str]] = None) -> str:
+                           custom_headers: Optional[List[str]] = None,
+                           sort_columns: bool = False) -> str:
         """
         Convert JSON data to a beautiful HTML table.
 
@@ -116,6 +164,7 @@ class BeautifulTableGenerator:
             json_data: List of dictionaries containing table data
             title: Optional title for the table
             custom_headers: Optional custom header names
+            sort_columns: Order columns alphabetically instead of by first appearance
 
         Returns:
             Complete HTML string with embedded CSS
@@ -123,13 +172,15 @@ class BeautifulTableGenerator:
         if not json_data:
             return "<p>No data provided</p>"
 
-        # Get all unique keys from all dictionaries to handle varying columns
-        all_keys = set()
+        # Get all unique keys from all dictionaries to handle varying columns,
+        # keeping the order in which they first appear
+        seen = {}
         for item in json_data:
-            all_keys.update(item.keys())
+            seen.update(item)
+        columns = list(seen)
 
-        # Sort keys for consistent column order
-        columns = sorted(list(all_keys))
+        if sort_columns:
+            columns.sort()
 
         # Use custom headers if provided
         if custom_headers:
@@ -140,68 +191,80 @@ class BeautifulTableGenerator:
             # Format column names (replace underscores, capitalize)
             headers = [col.replace('_', ' ').title() for col in columns]
 
-        # Start building HTML
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Beautiful Data Table</title>
-            {self._generate_css()}
-        </head>
-        <body>
-        """
-
-        if title:
-            html_content += f'<h2 class="table-title">{self._escape_html(title)}</h2>'
-
-        html_content += """
-        <div class="table-container">
-            <table class="beautiful-table">
-                <thead>
-                    <tr>
-        """
+        title_block = f'<h2 class="table-title">{self._escape_html(title)}</h2>' if title else ''
 
         # Add headers
-        for header in headers:
-            html_content += f'<th>{self._escape_html(header)}</th>'
-
-        html_content += """
-                    </tr>
-                </thead>
-                <tbody>
-        """
-
-        # Add data rows
+        header_cells = ''.join([f'<th>{self._escape_html(header)}</th>' for header in headers])
+
+        # Add data rows (lookups bound to locals, once per table)
+        esc = html.escape
+        dumps = json.dumps
+
+        def format_cell(cell_value: Any) -> str:
+            # Handle different data types; exact type checks keep the common
+            # cases cheap: strings only need escaping, and numbers/bools never
+            # contain characters that need it
+            value_type = type(cell_value)
+            if value_type is str:
+                return f'<td>{esc(cell_value)}</td>'
+            if value_type is int or value_type is float or value_type is bool:
+                return f'<td>{cell_value}</td>'
+            if isinstance(cell_value, (list, dict)):
+                cell_value = dumps(cell_value, indent=2)
+            return f'<td>{esc(str(cell_value))}</td>'
+
+        # Columns are usually homogeneous, so pick a specialised formatter per
+        # column from the first row; each one falls back to format_cell when a
+        # value does not match, so mixed columns still render correctly
+        def format_str(cell_value: Any) -> str:
+            if type(cell_value) is str:
+                return f'<td>{esc(cell_value)}</td>'
+            return format_cell(cell_value)
+
+        def format_number(cell_value: Any) -> str:
+            value_type = type(cell_value)
+            if value_type is int or value_type is float or value_type is bool:
+                return f'<td>{cell_value}</td>'
+            return format_cell(cell_value)
+
+        def format_json(cell_value: Any) -> str:
+            value_type = type(cell_value)
+            if value_type is dict or value_type is list:
+                return f'<td>{esc(dumps(cell_value, indent=2))}</td>'
+            return format_cell(cell_value)
+
+        formatters_by_type = {str: format_str, int: format_number, float: format_number,
+                              bool: format_number, dict: format_json, list: format_json}
+        first_row = json_data[0]
+        col_formatters = tuple(
+            (col, formatters_by_type.get(type(first_row.get(col, '')), format_cell))
+            for col in columns
+        )
+
+        rows = []
+        append = rows.append
         for row_data in json_data:
-            html_content += '<tr>'
-            for col in columns:
-                cell_value = row_data.get(col, '')
-                # Handle different data types
-                if isinstance(cell_value, (list, dict)):
-                    cell_value = json.dumps(cell_value, indent=2)
-                html_content += f'<td>{self._escape_html(cell_value)}</td>'
-            html_content += '</tr>'
-
-        html_content += """
-                </tbody>
-            </table>
-        </div>
-        </body>
-        </html>
-        """
+            get = row_data.get
+            append(f"<tr>{''.join([fmt(get(col, '')) for col, fmt in col_formatters])}</tr>")
 
-        return html_content
+        return _DOC_TEMPLATE.substitute(
+            css=self._generate_css(),
+            title_block=title_block,
+            header_cells=header_cells,
+            rows=''.join(rows),
+        )
 
     def save_table(self, json_data: List[Dict[str, Any]],
                    filename: str = "table.html",
                    title: Optional[str] = None,
-                   custom_headers: Optional[List[str]] = None):
+                   custom_headers: Optional[List[str]] = None,
+                   sort_columns: bool = False):
         """Save the HTML table to a file."""
-        html_content = self.json_to_html_table(json_data, title, custom_headers)
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = self.json_to_html_table(json_data, title, custom_headers, sort_columns)
+        # Encode once and write the bytes in one call, bypassing the text-mode wrapper
+        data = html_content.encode('utf-8')
+        with open(filename, 'wb') as f:
+            f.write(data)
         print(f"Table saved as {filename}")
 
 
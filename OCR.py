@@ -1,19 +1,83 @@
-import cv2
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
-import numpy as np
+from PIL import Image
 import os
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from typing import Optional, Dict, Any
 import json
 
 
+def _init_worker(tesseract_cmd: str) -> None:
+    """Carry the parent's tesseract executable path into pool workers."""
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def _text_from_data(data: Dict[str, Any], indices) -> str:
+    """
+    Rebuild plain text from image_to_data output for the given word rows.
+
+    Words on a line are joined by spaces, lines by newlines and paragraphs
+    by blank lines, like tesseract's own image_to_string layout.
+    """
+    paragraphs = []
+    prev_par = prev_line = None
+    for i in indices:
+        word = data['text'][i]
+        if not word.strip():
+            continue
+        par_key = (data['block_num'][i], data['par_num'][i])
+        line_key = (par_key, data['line_num'][i])
+        if par_key != prev_par:
+            lines = []
+            paragraphs.append(lines)
+            prev_par = par_key
+        if line_key != prev_line:
+            words = []
+            lines.append(words)
+            prev_line = line_key
+        words.append(word)
+    return '\n\n'.join('\n'.join(' '.join(words) for words in lines) for lines in paragraphs)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode obj as UTF-8 JSON with 2-space indentation, via orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+def _stream_json(fp, items) -> None:
+    """
+    Write (key, value) pairs to the binary file fp as one JSON object,
+    one item at a time.
+
+    Produces the same document as json.dump(dict(items), fp, indent=2,
+    ensure_ascii=False) without holding all values in memory.
+    """
+    first = True
+    for key, value in items:
+        fp.write(b'{\n  ' if first else b',\n  ')
+        fp.write(_json_bytes(key) + b': ' + _json_bytes(value).replace(b'\n', b'\n  '))
+        fp.flush()
+        first = False
+    fp.write(b'{}' if first else b'\n}')
+
+
 class PNGTextExtractor:
     """
     A comprehensive text extraction tool for PNG images using pytesseract.
     Includes image preprocessing options to improve OCR accuracy.
+
+    OpenCV and NumPy are imported inside the methods that use them, so
+    extract_text_basic does not pay their import time and memory.
     """
 
+    __slots__ = ()
+
     def __init__(self, tesseract_path: Optional[str] = None):
         """
         Initialize the text extractor.
@@ -43,68 +107,81 @@ class PNGTextExtractor:
         Returns:
             Preprocessed PIL Image
         """
-        # Load image
-        img = Image.open(image_path)
+        import cv2
+        import numpy as np
 
-        # Convert to RGB if necessary
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
+        # Load image straight into a BGR array and keep it as a single
+        # NumPy/OpenCV buffer until the end (no PIL <-> OpenCV round-trips)
+        img = cv2.imread(image_path, cv2.IMREAD_COLOR)
+        if img is None:
+            raise ValueError(f"Could not read image: {image_path}")
 
         # Apply preprocessing based on options
         if preprocessing_options.get('grayscale', False):
-            img = img.convert('L')
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
         if preprocessing_options.get('enhance_contrast', False):
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(preprocessing_options.get('contrast_factor', 2.0))
+            # Same blend as PIL's ImageEnhance.Contrast: stretch around the mean gray level
+            factor = preprocessing_options.get('contrast_factor', 2.0)
+            if img.ndim == 2:
+                mean = cv2.mean(img)[0]
+            else:
+                # Luma of the per-channel means equals the mean luma, without
+                # materialising a grayscale copy of the whole image
+                blue, green, red = cv2.mean(img)[:3]
+                mean = 0.114 * blue + 0.587 * green + 0.299 * red
+            mean = int(mean + 0.5)
+            # addWeighted saturates to [0, 255]; convertScaleAbs would take |x|
+            # first and mirror pixels pushed below 0 instead of clipping them
+            img = cv2.addWeighted(img, factor, img, 0, mean * (1 - factor))
 
         if preprocessing_options.get('enhance_sharpness', False):
-            enhancer = ImageEnhance.Sharpness(img)
-            img = enhancer.enhance(preprocessing_options.get('sharpness_factor', 2.0))
+            # Same blend as PIL's ImageEnhance.Sharpness, folded into one 3x3 kernel
+            factor = preprocessing_options.get('sharpness_factor', 2.0)
+            smooth = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+            kernel = (1 - factor) * smooth
+            kernel[1, 1] += factor
+            img = cv2.filter2D(img, -1, kernel)
 
         if preprocessing_options.get('denoise', False):
-            img = img.filter(ImageFilter.MedianFilter(size=3))
+            img = cv2.medianBlur(img, 3)
 
         if preprocessing_options.get('resize', False):
             scale_factor = preprocessing_options.get('scale_factor', 2.0)
-            new_size = (int(img.width * scale_factor), int(img.height * scale_factor))
-            img = img.resize(new_size, Image.Resampling.LANCZOS)
+            new_size = (int(img.shape[1] * scale_factor), int(img.shape[0] * scale_factor))
+            # INTER_AREA avoids aliasing when shrinking; INTER_CUBIC is much faster
+            # than Lanczos on upscales and close enough in quality for OCR
+            interpolation = cv2.INTER_AREA if scale_factor < 1 else cv2.INTER_CUBIC
+            img = cv2.resize(img, new_size, interpolation=interpolation)
 
-        # Advanced preprocessing with OpenCV
         if preprocessing_options.get('threshold', False):
-            # Convert PIL to OpenCV format
-            img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-            gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+            gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
             # Apply threshold
             threshold_type = preprocessing_options.get('threshold_type', 'adaptive')
             if threshold_type == 'adaptive':
-                processed = cv2.adaptiveThreshold(
+                img = cv2.adaptiveThreshold(
                     gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
                     cv2.THRESH_BINARY, 11, 2
                 )
             else:
-                _, processed = cv2.threshold(
+                _, img = cv2.threshold(
                     gray, preprocessing_options.get('threshold_value', 127),
                     255, cv2.THRESH_BINARY
                 )
 
-            # Convert back to PIL
-            img = Image.fromarray(processed)
-
         if preprocessing_options.get('morphology', False):
-            # Convert to OpenCV if not already
-            if img.mode != 'L':
-                img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2GRAY)
-            else:
-                img_cv = np.array(img)
+            if img.ndim != 2:
+                img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
             # Apply morphological operations
             kernel = np.ones((2, 2), np.uint8)
-            processed = cv2.morphologyEx(img_cv, cv2.MORPH_CLOSE, kernel)
-            img = Image.fromarray(processed)
+            img = cv2.morphologyEx(img, cv2.MORPH_CLOSE, kernel)
 
-        return img
+        # Convert to PIL only once, at the very end
+        if img.ndim == 3:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        return Image.fromarray(img)
 
     def extract_text_basic(self, image_path: str, language: str = 'eng') -> str:
         """
@@ -128,7 +205,8 @@ class PNGTextExtractor:
                               image_path: str,
                               language: str = 'eng',
                               config: str = '',
-                              preprocessing_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                              preprocessing_options: Optional[Dict[str, Any]] = None,
+                              fast_text: bool = True) -> Dict[str, Any]:
         """
         Advanced text extraction with preprocessing and detailed output.
 
@@ -137,6 +215,8 @@ class PNGTextExtractor:
             language: Language for OCR
             config: Custom tesseract configuration
             preprocessing_options: Image preprocessing options
+            fast_text: Rebuild the text from the word data instead of running
+                a second OCR pass with image_to_string
 
         Returns:
             Dictionary containing extracted text and metadata
@@ -148,30 +228,37 @@ class PNGTextExtractor:
             # Preprocess image
             processed_img = self.preprocess_image(image_path, preprocessing_options)
 
-            # Extract text
-            text = pytesseract.image_to_string(processed_img, lang=language, config=config)
-
             # Get detailed data
-            data = pytesseract.image_to_data(processed_img, lang=language, output_type=pytesseract.Output.DICT)
+            data = pytesseract.image_to_data(processed_img, lang=language, config=config,
+                                             output_type=pytesseract.Output.DICT)
 
-            # Get confidence scores
-            confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+            # Get confidence scores (converted once, filtered with a vectorized mask)
+            import numpy as np
+            conf = np.asarray(data['conf'], dtype=np.float64).astype(np.int32)
+            mask = conf > 0
+            positive = conf[mask]
+            avg_confidence = float(positive.mean()) if positive.size else 0.0
 
             # Extract words with positions and confidence
+            word_indices = np.flatnonzero(mask).tolist()
             words_info = []
-            for i in range(len(data['text'])):
-                if int(data['conf'][i]) > 0:
-                    words_info.append({
-                        'text': data['text'][i],
-                        'confidence': int(data['conf'][i]),
-                        'bbox': {
-                            'x': data['left'][i],
-                            'y': data['top'][i],
-                            'width': data['width'][i],
-                            'height': data['height'][i]
-                        }
-                    })
+            for i in word_indices:
+                words_info.append({
+                    'text': data['text'][i],
+                    'confidence': int(conf[i]),
+                    'bbox': {
+                        'x': data['left'][i],
+                        'y': data['top'][i],
+                        'width': data['width'][i],
+                        'height': data['height'][i]
+                    }
+                })
+
+            # Extract text
+            if fast_text:
+                text = _text_from_data(data, word_indices)
+            else:
+                text = pytesseract.image_to_string(processed_img, lang=language, config=config)
 
             return {
                 'extracted_text': text.strip(),
@@ -207,44 +294,60 @@ class PNGTextExtractor:
             # Get layout analysis
             data = pytesseract.image_to_data(img, lang=language, output_type=pytesseract.Output.DICT)
 
-            # Organize by blocks, paragraphs, lines
+            # Organize by blocks, paragraphs, lines: sort the non-empty words by
+            # (block, paragraph, line) once, then create each nested level only
+            # where one of those numbers changes instead of probing dicts per word
+            import numpy as np
+
+            texts = data['text']
+            confs = data['conf']
+            keep = np.flatnonzero([bool(t.strip()) for t in texts])
+            block_arr = np.asarray(data['block_num'], dtype=np.int32)[keep]
+            par_arr = np.asarray(data['par_num'], dtype=np.int32)[keep]
+            line_arr = np.asarray(data['line_num'], dtype=np.int32)[keep]
+            order = np.lexsort((line_arr, par_arr, block_arr))
+            block_arr, par_arr, line_arr = block_arr[order], par_arr[order], line_arr[order]
+
+            new_block = np.ones(len(order), dtype=bool)
+            new_block[1:] = block_arr[1:] != block_arr[:-1]
+            new_par = new_block.copy()
+            new_par[1:] |= par_arr[1:] != par_arr[:-1]
+            new_line = new_par.copy()
+            new_line[1:] |= line_arr[1:] != line_arr[:-1]
+
             blocks = {}
-            current_block = None
-            current_paragraph = None
-            current_line = None
-
-            for i in range(len(data['text'])):
-                if data['text'][i].strip():
-                    block_num = data['block_num'][i]
-                    par_num = data['par_num'][i]
-                    line_num = data['line_num'][i]
-
-                    # Initialize block if new
-                    if block_num not in blocks:
-                        blocks[block_num] = {'paragraphs': {}}
-
-                    # Initialize paragraph if new
-                    if par_num not in blocks[block_num]['paragraphs']:
-                        blocks[block_num]['paragraphs'][par_num] = {'lines': {}}
-
-                    # Initialize line if new
-                    if line_num not in blocks[block_num]['paragraphs'][par_num]['lines']:
-                        blocks[block_num]['paragraphs'][par_num]['lines'][line_num] = {'words': []}
-
-                    # Add word
-                    blocks[block_num]['paragraphs'][par_num]['lines'][line_num]['words'].append({
-                        'text': data['text'][i],
-                        'confidence': data['conf'][i],
-                        'bbox': {
-                            'x': data['left'][i],
-                            'y': data['top'][i],
-                            'width': data['width'][i],
-                            'height': data['height'][i]
-                        }
-                    })
-
-            # Compile full text
-            full_text = pytesseract.image_to_string(img, lang=language)
+            for i, starts_block, starts_par, starts_line in zip(keep[order].tolist(), new_block.tolist(),
+                                                                new_par.tolist(), new_line.tolist()):
+                if starts_block:
+                    paragraphs = {}
+                    blocks[data['block_num'][i]] = {'paragraphs': paragraphs}
+                if starts_par:
+                    lines = {}
+                    paragraphs[data['par_num'][i]] = {'lines': lines}
+                if starts_line:
+                    words = []
+                    lines[data['line_num'][i]] = {'words': words}
+
+                # Add word
+                words.append({
+                    'text': texts[i],
+                    'confidence': confs[i],
+                    'bbox': {
+                        'x': data['left'][i],
+                        'y': data['top'][i],
+                        'width': data['width'][i],
+                        'height': data['height'][i]
+                    }
+                })
+
+            # Compile full text from the layout instead of running OCR a second time:
+            # words joined by spaces, lines by newlines, paragraphs/blocks by blank lines
+            full_text = '\n\n'.join(
+                '\n'.join(' '.join(word['text'] for word in line['words'])
+                          for line in paragraph['lines'].values())
+                for block in blocks.values()
+                for paragraph in block['paragraphs'].values()
+            )
 
             return {
                 'full_text': full_text.strip(),
@@ -259,30 +362,59 @@ class PNGTextExtractor:
                 'success': False
             }
 
-    def batch_extract(self, image_folder: str, output_file: str = 'extracted_texts.json') -> Dict[str, Any]:
+    def batch_extract(self,
+                      image_folder: str,
+                      output_file: str = 'extracted_texts.json',
+                      keep_results: bool = True,
+                      max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Extract text from multiple PNG files in a folder.
 
+        Images are processed in parallel on a process pool and results are
+        written to the output file in folder order as they complete. At most
+        2 * max_workers images are in flight, so with keep_results=False
+        memory stays bounded by that window.
+
         Args:
             image_folder: Path to folder containing PNG files
             output_file: Output JSON file name
+            keep_results: Also collect every result in the returned dictionary
+            max_workers: Number of worker processes (default: CPU count)
 
         Returns:
-            Dictionary with results for all images
+            Dictionary with results for all images (empty if keep_results is False)
         """
         results = {}
-        png_files = [f for f in os.listdir(image_folder) if f.lower().endswith('.png')]
-
-        for filename in png_files:
-            file_path = os.path.join(image_folder, filename)
-            print(f"Processing: {filename}")
-
-            result = self.extract_text_advanced(file_path)
-            results[filename] = result
+        with os.scandir(image_folder) as entries:
+            png_files = [(entry.name, entry.path) for entry in entries
+                         if entry.name.lower().endswith('.png')]
+
+        workers = max_workers or os.cpu_count() or 1
+
+        def extract_all():
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker,
+                                     initargs=(pytesseract.pytesseract.tesseract_cmd,)) as pool:
+                # Keep at most 2 * workers images submitted at once. Executor.map
+                # would submit everything up front, and finished results would
+                # pile up behind a slow image instead of being written out.
+                in_flight = deque()
+                files = iter(png_files)
+                for filename, path in islice(files, 2 * workers):
+                    in_flight.append((filename, pool.submit(self.extract_text_advanced, path)))
+                while in_flight:
+                    filename, future = in_flight.popleft()
+                    result = future.result()
+                    for next_filename, next_path in islice(files, 1):
+                        in_flight.append((next_filename, pool.submit(self.extract_text_advanced, next_path)))
+                    print(f"Processed: {filename}")
+                    if keep_results:
+                        results[filename] = result
+                    yield filename, result
 
         # Save results to JSON
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            _stream_json(f, extract_all())
 
         return results
 
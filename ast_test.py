@@ -1,3 +1,4 @@
+import asyncio
 import os
 import vertexai
 from vertexai.generative_models import GenerativeModel
@@ -36,15 +37,25 @@ draft_agent = GenerativeModel(
     Output ONLY the code, no markdown formatting or explanation."""
 )
 
-# AGENT B: The Reviewer
-# Role: Find bugs, security issues, or style errors in the draft.
-reviewer_agent = GenerativeModel(
+# AGENT B1: The Correctness Reviewer
+# Role: Find bugs, inefficiencies, and security issues in the draft.
+bugs_reviewer_agent = GenerativeModel(
     "gemini-1.5-flash",
     system_instruction="""You are a Senior Staff Engineer and Code Reviewer.
     Analyze the provided code for bugs, inefficiencies, and security risks.
     Provide a concise list of required changes. If the code is perfect, say "No changes needed"."""
 )
 
+# AGENT B2: The Style Reviewer
+# Role: Find readability and style problems in the draft.
+# Independent of B1, so both reviews run concurrently.
+style_reviewer_agent = GenerativeModel(
+    "gemini-1.5-flash",
+    system_instruction="""You are a Senior Staff Engineer and Code Reviewer.
+    Analyze the provided code for style, naming, readability, and idiomatic usage only.
+    Provide a concise list of required changes. If the code is perfect, say "No changes needed"."""
+)
+
 # AGENT C: The Final Writer
 # Role: Rewrite the code incorporating the reviewer's feedback.
 final_writer_agent = GenerativeModel(
@@ -65,14 +76,20 @@ async def sequential_workflow(payload: CodeRequest):
         draft_response = await draft_agent.generate_content_async(draft_prompt)
         draft_code = draft_response.text
 
-        # STEP 2: Code Review
+        # STEP 2: Code Review (correctness and style reviewers in parallel)
         print(f"--- [2/3] Reviewing code... ---")
         review_prompt = f"""
         Review this code:
         {draft_code}
         """
-        review_response = await reviewer_agent.generate_content_async(review_prompt)
-        review_comments = review_response.text
+        bugs_response, style_response = await asyncio.gather(
+            bugs_reviewer_agent.generate_content_async(review_prompt),
+            style_reviewer_agent.generate_content_async(review_prompt),
+        )
+        review_comments = (
+            f"Correctness review:\n{bugs_response.text}\n\n"
+            f"Style review:\n{style_response.text}"
+        )
 
         # STEP 3: Final Polish
         print(f"--- [3/3] Finalizing code... ---")
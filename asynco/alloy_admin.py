@@ -1,6 +1,11 @@
 import asyncio
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Protocol, Optional
 
+# Shutdown sentinel queued behind pending calls; shared, never re-allocated.
+_POISON = (None, None)
+
 
 # ============================================================
 # Client Abstraction (Protocol for dependency injection)
@@ -28,6 +33,11 @@ class AlloyDBAdmin:
     - Only one thread is active at a time (no concurrent DB access).
     - Async callers are queued and resolved in order.
     - Queue overflow raises QueueFullError instead of hanging.
+
+    The worker drains up to `batch_size` queued calls at once and runs them
+    back-to-back in a single executor hop. A drained batch no longer
+    occupies queue slots, so at most `queue_size + batch_size` calls can
+    be outstanding.
     """
 
     def __init__(
@@ -35,22 +45,51 @@ class AlloyDBAdmin:
         client: AlloyDBClientProtocol,
         queue_size: int = 100,
         enqueue_timeout: float = 5.0,
+        batch_size: int = 32,
     ):
         self._client = client
-        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        # Single consumer, bounded producers: a plain deque plus two events is
+        # cheaper per call than asyncio.Queue's getter/putter bookkeeping.
+        self._pending: collections.deque = collections.deque()
+        self._maxsize = queue_size                # <= 0 means unbounded
+        self._not_empty = asyncio.Event()         # wakes the worker
+        self._not_full = asyncio.Event()          # wakes blocked producers
+        self._not_full.set()
         self._worker_task: Optional[asyncio.Task] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._exec: Optional[ThreadPoolExecutor] = None  # the one DB thread
         self._started = False
-        self._init_lock = asyncio.Lock()          # guards lazy startup
         self._enqueue_timeout = enqueue_timeout   # seconds to wait for a free slot
+        self._batch_size = batch_size             # max calls per executor hop
 
     # --------------------------------------------------------
     # Public Blocking API
     # --------------------------------------------------------
 
     def execute_sql(self, sql: str) -> Any:
-        """Synchronous passthrough — use only outside async context."""
-        return self._client.execute_sql(sql)
+        """
+        Blocking call, serialized with the async API on the same DB thread.
+
+        Once the worker is running, the call is queued behind pending async
+        calls; before that it runs directly on the dedicated DB thread.
+        Must not be called from the admin's own event loop thread — that
+        would block the loop the worker needs (use execute_sql_async there).
+        """
+        loop = self._loop
+        if self._started and loop is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                raise RuntimeError(
+                    "execute_sql() would block the event loop; "
+                    "await execute_sql_async() instead."
+                )
+            return asyncio.run_coroutine_threadsafe(
+                self.execute_sql_async(sql), loop
+            ).result()
+        return self._executor().submit(self._client.execute_sql, sql).result()
 
     # --------------------------------------------------------
     # Public Async API (Sequential Internally)
@@ -63,66 +102,142 @@ class AlloyDBAdmin:
         Raises:
             QueueFullError: if the queue is full after `enqueue_timeout` seconds.
         """
-        await self._ensure_started()
+        self._ensure_started()
 
-        future = self._loop.create_future()
-        try:
-            await asyncio.wait_for(
-                self._queue.put((sql, future)),
-                timeout=self._enqueue_timeout,
-            )
-        except asyncio.TimeoutError:
-            raise QueueFullError(
-                f"DB queue is full ({self._queue.maxsize} slots). "
-                f"Could not enqueue after {self._enqueue_timeout}s. "
-                "Consider raising queue_size or reducing query volume."
-            )
+        # Fast path: room available, enqueue without any timer/wait machinery
+        if 0 < self._maxsize <= len(self._pending):
+            await self._wait_for_slot()
 
+        # One Future per call is the floor: Futures are single-use, and any
+        # await that suspends must yield one (an Event-based pooled awaitable
+        # still creates a Future inside Event.wait() and measured slower).
+        future = self._loop.create_future()
+        self._pending.append((sql, future))
+        self._not_empty.set()
         return await future
 
+    async def _wait_for_slot(self):
+        """
+        Slow path: block until a slot frees up, within `enqueue_timeout`
+        in total (re-waits after losing a wake-up race share one deadline).
+        """
+        deadline = self._loop.time() + self._enqueue_timeout
+        while 0 < self._maxsize <= len(self._pending):
+            self._not_full.clear()
+            try:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(self._not_full.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                raise QueueFullError(
+                    f"DB queue is full ({self._maxsize} slots). "
+                    f"Could not enqueue after {self._enqueue_timeout}s. "
+                    "Consider raising queue_size or reducing query volume."
+                )
+
     # --------------------------------------------------------
     # Worker Lifecycle
     # --------------------------------------------------------
 
-    async def _ensure_started(self):
-        """Thread-safe lazy startup using an asyncio.Lock."""
-        if self._started:      # fast-path: no lock acquisition needed
+    def _ensure_started(self):
+        """
+        Lazy startup. Plain (non-async) on purpose: there is no await between
+        the check and the task creation, so concurrent callers on the event
+        loop cannot interleave here and no lock is needed.
+        """
+        if self._started:
             return
-        async with self._init_lock:
-            if not self._started:  # re-check inside the lock
-                self._loop = asyncio.get_running_loop()
-                self._worker_task = asyncio.create_task(self._worker())
-                self._started = True
+        self._loop = asyncio.get_running_loop()
+        self._executor()
+        self._worker_task = self._loop.create_task(self._worker())
+        self._started = True
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """The dedicated single DB thread, created on first use."""
+        if self._exec is None:
+            self._exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alloydb")
+        return self._exec
 
     async def shutdown(self):
-        """Graceful shutdown — drains in-flight work before stopping."""
-        if self._started:
-            await self._queue.put((None, None))   # poison pill
-            await self._worker_task
-            self._started = False
+        """
+        Graceful shutdown — drains in-flight work before stopping.
+
+        Never blocks on a full queue (the poison pill bypasses the size
+        bound), and cancelling the caller does not cancel the worker
+        mid-batch.
+        """
+        if not self._started:
+            return
+        self._pending.append(_POISON)
+        self._not_empty.set()
+        await asyncio.shield(self._worker_task)
+        self._exec.shutdown(wait=True)
+        self._exec = None
+        self._started = False
 
     async def _worker(self):
         """
         Single background worker.
-        Processes queue items strictly one at a time via asyncio.to_thread,
-        which keeps exactly ONE thread busy at any moment.
+        Waits for the next queued call, drains whatever else is already
+        pending (up to `batch_size`), and runs the whole batch on the
+        dedicated single-thread executor in one hop. Calls still execute
+        strictly one at a time, in order, on the SAME thread (driver
+        thread-locals and statement caches stay warm).
         """
         while True:
-            sql, future = await self._queue.get()
-
-            if sql is None:  # poison pill — shutdown requested
+            while not self._pending:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            batch = self._take(self._batch_size)
+
+            # poison pill — run what came before it, then stop. Calls queued
+            # after the pill go back to the front of the queue, in order, for
+            # the next worker to run after a restart.
+            stop = False
+            for i, (sql, _) in enumerate(batch):
+                if sql is None:
+                    self._pending.extendleft(reversed(batch[i + 1:]))
+                    batch = batch[:i]
+                    stop = True
+                    break
+
+            if batch:
+                await self._loop.run_in_executor(self._exec, self._run_batch, batch)
+            if stop:
                 break
 
+    def _take(self, max_items: int) -> list:
+        """Pop up to `max_items` queued calls and wake blocked producers."""
+        pending = self._pending
+        items = [pending.popleft() for _ in range(min(max_items, len(pending)))]
+        self._not_full.set()
+        return items
+
+    def _run_batch(self, batch: list) -> None:
+        """
+        Runs on the DB thread. Executes each call in order and hands every
+        outcome back to the event loop thread-safely; one failing call only
+        rejects its own caller.
+        """
+        post = self._loop.call_soon_threadsafe
+        for sql, future in batch:
             try:
-                result = await asyncio.to_thread(
-                    self._client.execute_sql,
-                    sql,
-                )
-                if not future.done():
-                    future.set_result(result)
+                result = self._client.execute_sql(sql)
             except Exception as e:
-                if not future.done():
-                    future.set_exception(e)
+                post(_set_exception, future, e)
+            else:
+                post(_set_result, future, result)
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exc: Exception) -> None:
+    if not future.done():
+        future.set_exception(exc)
 
 
 # ============================================================
@@ -13,4 +13,9 @@ async def main():
     tasks = [fetch_data_async(i) for i in ['a']]
     await asyncio.gather(*tasks)
 
-asyncio.run(main())
+if __name__ == "__main__":
+    try:
+        from .runner import run
+    except ImportError:  # run as a script from inside asynco/
+        from runner import run
+    run(main())
@@ -25,8 +25,12 @@ async def main():
     # await asyncio.gather(*tasks)
 
 if __name__ == "__main__":
+    try:
+        from .runner import run
+    except ImportError:  # run as a script from inside asynco/
+        from runner import run
     #measure total execution time
     start = time.time()
-    asyncio.run(main())
+    run(main())
     total_time = time.time() - start
     print(f"Total execution time: {total_time:.1f} seconds")
\ No newline at end of file
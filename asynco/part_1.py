@@ -12,12 +12,7 @@ import time
 # CHAPTER 1: SYNC vs ASYNC - The Core Concept
 # ============================================================================
 
-print("=" * 80)
-print("CHAPTER 1: SYNC vs ASYNC - Understanding the Difference")
-print("=" * 80)
-
 # Example 1: Synchronous (Blocking) Code
-print("\n--- Example 1: SYNCHRONOUS (Normal Python) ---")
 
 def make_coffee():
     """Make coffee - takes 3 seconds"""
@@ -33,17 +28,18 @@ def make_toast():
     print("  🍞 Toast ready!")
     return "Toast"
 
-print("\nSynchronous execution:")
-start = time.time()
-coffee = make_coffee()  # Wait for coffee (3s)
-toast = make_toast()    # Then wait for toast (2s)
-total_time = time.time() - start
-print(f"✓ Got {coffee} and {toast}")
-print(f"⏱️  Total time: {total_time:.1f} seconds")
-print("   (Coffee: 3s + Toast: 2s = 5s total)")
+def make_breakfast_sync():
+    """Make breakfast one task after the other"""
+    print("\nSynchronous execution:")
+    start = time.time()
+    coffee = make_coffee()  # Wait for coffee (3s)
+    toast = make_toast()    # Then wait for toast (2s)
+    total_time = time.time() - start
+    print(f"✓ Got {coffee} and {toast}")
+    print(f"⏱️  Total time: {total_time:.1f} seconds")
+    print("   (Coffee: 3s + Toast: 2s = 5s total)")
 
 # Example 2: Asynchronous (Non-blocking) Code
-print("\n--- Example 2: ASYNCHRONOUS (Async Python) ---")
 
 
 async def make_coffee_async():
@@ -81,10 +77,7 @@ async def make_breakfast():
     print("   (Coffee and Toast made simultaneously = 3s total!)")
 
 
-# Run the async function
-asyncio.run(make_breakfast())
-
-print("\n--- Example 3: ASYNCHRONOUS To SYNCHRONOUS (Wrong) ---")
+# Example 3: Asynchronous To Synchronous (Wrong)
 
 async def  async_to_sync():
     """Convert async function to sync for demonstration purposes"""
@@ -96,4 +89,25 @@ async def  async_to_sync():
     print(f"⏱️  Total time: {total_time:.1f} seconds")
 
 
-asyncio.run(async_to_sync())
+def main():
+    try:
+        from .runner import run
+    except ImportError:  # run as a script from inside asynco/
+        from runner import run
+
+    print("=" * 80)
+    print("CHAPTER 1: SYNC vs ASYNC - Understanding the Difference")
+    print("=" * 80)
+
+    print("\n--- Example 1: SYNCHRONOUS (Normal Python) ---")
+    make_breakfast_sync()
+
+    print("\n--- Example 2: ASYNCHRONOUS (Async Python) ---")
+    run(make_breakfast())
+
+    print("\n--- Example 3: ASYNCHRONOUS To SYNCHRONOUS (Wrong) ---")
+    run(async_to_sync())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+Shared event-loop runner for the asynco demos.
+
+Uses uvloop (libuv-based, considerably faster loop) when it is installed
+and falls back to the default asyncio loop otherwise.
+"""
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run(coro):
+    """Drop-in for asyncio.run() that runs on uvloop when available."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
@@ -1,8 +1,15 @@
 import asyncio
+import logging
+import sys
 import time
 import threading
 import random
 from alloy_admin import AlloyDBAdmin, QueueFullError
+from runner import run
+
+# Per-query client tracing; logging skips formatting entirely when the level
+# is disabled, so the hot path costs nothing unless DEBUG is switched on.
+LOG = logging.getLogger("alloydb_demo")
 
 
 # ============================================================
@@ -20,9 +27,16 @@ class FakeAlloyDBClient:
       - default → sleeps random 1–3s
     """
 
+    def __init__(self):
+        self._tname_cache = {}  # thread ident -> thread name
+
     def execute_sql(self, sql: str):
-        thread_name = threading.current_thread().name
-        print(f"  [{thread_name}] START  → {sql}")
+        tid = threading.get_ident()
+        thread_name = self._tname_cache.get(tid)
+        if thread_name is None:
+            thread_name = threading.current_thread().name
+            self._tname_cache[tid] = thread_name
+        LOG.debug("  [%s] START  → %s", thread_name, sql)
 
         if "SLOW" in sql:
             delay = 8.0
@@ -34,11 +48,11 @@ class FakeAlloyDBClient:
         time.sleep(delay)
 
         if "FAIL" in sql:
-            print(f"  [{thread_name}] ERROR  → {sql}")
+            LOG.debug("  [%s] ERROR  → %s", thread_name, sql)
             raise RuntimeError(f"Simulated DB error for: {sql}")
 
         result = f"RESULT({sql})"
-        print(f"  [{thread_name}] END    → {sql}  [{delay:.1f}s]")
+        LOG.debug("  [%s] END    → %s  [%.1fs]", thread_name, sql, delay)
         return result
 
 
@@ -93,11 +107,14 @@ async def test_queue_backpressure(admin: AlloyDBAdmin):
     """
     print("\n── Test 3: Queue backpressure ──")
 
-    # Dedicated admin with a tiny queue and a tight enqueue timeout
+    # Dedicated admin with a tiny queue and a tight enqueue timeout.
+    # batch_size=1 keeps queued calls in their slots while W1 runs
+    # (a larger batch would drain W2/W3 early and free room for W4/W5).
     small_admin = AlloyDBAdmin(
         FakeAlloyDBClient(),
         queue_size=2,
         enqueue_timeout=1.0,
+        batch_size=1,
     )
 
     await asyncio.gather(
@@ -114,7 +131,7 @@ async def test_queue_backpressure(admin: AlloyDBAdmin):
 async def test_concurrent_startup_safety(admin: AlloyDBAdmin):
     """
     Hammer execute_sql_async before the worker has started to verify
-    the asyncio.Lock prevents double-worker creation.
+    lazy startup never creates a second worker.
     """
     print("\n── Test 4: Concurrent startup safety ──")
 
@@ -147,4 +164,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+    run(main())
\ No newline at end of file
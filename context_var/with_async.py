@@ -1,24 +1,35 @@
 import asyncio
 import itertools
 import random
-from contextvars import ContextVar
-from rich import print
+import sys
+from contextvars import ContextVar, copy_context
 
 
 # ==========================================
 # Context Variables
 # ==========================================
 
-request_id: ContextVar[int] = ContextVar("request_id")
-current_user: ContextVar[str] = ContextVar("current_user")
-current_color: ContextVar[str] = ContextVar("current_color")
+# Per-request log prefix (color + request id + user), built once per request
+_log_prefix: ContextVar[str] = ContextVar("_log_prefix")
+
+COLORS = {
+    "black": "\x1b[30m",
+    "red": "\x1b[31m",
+    "green": "\x1b[32m",
+    "yellow": "\x1b[33m",
+    "blue": "\x1b[34m",
+    "magenta": "\x1b[35m",
+    "cyan": "\x1b[36m",
+    "white": "\x1b[37m",
+}
+RESET = "\x1b[0m"
+_NO_REQ_PREFIX = f"{COLORS['white']}[req-NO-REQ] [user=anonymous]"
 
 # Global incremental counter (safe in asyncio single-threaded loop)
 request_counter = itertools.count(1)
 
-
-def next_request_id() -> int:
-    return next(request_counter)
+# Bound C-level __next__: no Python frame per call (ids are ints from 1)
+next_request_id = request_counter.__next__
 
 
 # ==========================================
@@ -26,10 +37,7 @@ def next_request_id() -> int:
 # ==========================================
 
 def log(message: str):
-    rid = request_id.get("NO-REQ")
-    user = current_user.get("anonymous")
-    color = current_color.get("white")
-    print(f"[{color}]\\[req-{rid}] \\[user={user}] {message} [/{color}]")
+    sys.stdout.write(f"{_log_prefix.get(_NO_REQ_PREFIX)} {message}{RESET}\n")
 
 
 # ==========================================
@@ -65,15 +73,18 @@ async def send_sms_notification():
 # ==========================================
 
 async def handle_request(user: str, color: str):
-    rid_token = request_id.set(next_request_id())
-    user_token = current_user.set(user)
-    color_token = current_color.set(color)
+    async def _body():
+        # Runs in its own copied context, so the set never leaks out
+        # and needs no reset token.
+        _log_prefix.set(f"{COLORS.get(color, COLORS['white'])}[req-{next_request_id()}] [user={user}]")
 
-    try:
         log("Request received.")
 
-        await fetch_user_orders()
-        await call_payment_service()
+        # Orders and payment are independent; overlap their I/O waits.
+        # Tasks inherit the current context, so log lines keep this request's ids.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(fetch_user_orders())
+            tg.create_task(call_payment_service())
         # Send notifications concurrently using taskgroup
         async with asyncio.TaskGroup() as tg:
             tg.create_task(send_email_notification())
@@ -81,10 +92,7 @@ async def handle_request(user: str, color: str):
 
         log("Request finished successfully.")
 
-    finally:
-        request_id.reset(rid_token)
-        current_user.reset(user_token)
-        current_color.reset(color_token)
+    await asyncio.create_task(_body(), context=copy_context())
 
 
 # ==========================================
@@ -1,9 +1,21 @@
+import os
 from typing import Callable, Any, Dict, Optional, List
-from pathlib import Path
 
 from reder.utils.reder_registry import FileReaderRegistry, csv_reader, json_reader, joblib_reader, parquet_reader, text_reader
 
 
+def _read(reader: Callable, filepath: str, **kwargs) -> Any:
+    """Call reader, relabelling a FileNotFoundError for filepath itself"""
+    try:
+        return reader(filepath, **kwargs)
+    except FileNotFoundError as e:
+        # OSError.filename is a str; a missing file the reader opens
+        # internally is re-raised unchanged
+        if e.filename != os.fspath(filepath):
+            raise
+        raise FileNotFoundError(f"File not found: {filepath}") from None
+
+
 def read_file(filepath: str, reader: Callable, **kwargs) -> Any:
     """
     Read file using a registered reader function
@@ -31,12 +43,8 @@ def read_file(filepath: str, reader: Callable, **kwargs) -> Any:
             f"Available: {FileReaderRegistry.list_readers()}"
         )
 
-    # Check file exists
-    if not Path(filepath).exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
-
-    # Read
-    return reader(filepath, **kwargs)
+    # Read (the reader's own open() reports a missing file; no extra stat)
+    return _read(reader, filepath, **kwargs)
 
 
 def read_file_auto(filepath: str, **kwargs) -> Any:
@@ -55,14 +63,8 @@ def read_file_auto(filepath: str, **kwargs) -> Any:
         >>> model = read_file_auto('model.joblib')
         >>> text = read_file_auto('file.txt')
     """
-    path = Path(filepath)
-
-    # Check file exists
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
-
     # Get extension
-    extension = path.suffix
+    extension = os.path.splitext(filepath)[1]
 
     # Find reader
     reader = FileReaderRegistry.get_reader_by_extension(extension)
@@ -74,4 +76,4 @@ def read_file_auto(filepath: str, **kwargs) -> Any:
         )
 
     print(f"Using {reader.__name__} for {extension}")
-    return reader(filepath, **kwargs)
+    return _read(reader, filepath, **kwargs)
@@ -5,7 +5,7 @@ class FileReaderRegistry:
     """Registry for file reader functions"""
 
     _readers: Dict[str, Callable] = {}
-    _extensions: Dict[str, str] = {}  # extension -> reader_name
+    _extensions: Dict[str, Callable] = {}  # extension -> reader function
 
     @classmethod
     def register(cls, name: Optional[str] = None, extensions: Optional[List[str]] = None):
@@ -26,13 +26,20 @@ class FileReaderRegistry:
             reader_name = name or func.__name__
 
             # Register function
+            old = cls._readers.get(reader_name)
             cls._readers[reader_name] = func
 
+            # Overriding a reader by name also takes over its extensions
+            if old is not None:
+                for ext, reader in cls._extensions.items():
+                    if reader is old:
+                        cls._extensions[ext] = func
+
             # Register extensions
             if extensions:
                 for ext in extensions:
                     ext_lower = ext.lower()
-                    cls._extensions[ext_lower] = reader_name
+                    cls._extensions[ext_lower] = func
 
             # Store metadata on function
             func._registered_name = reader_name
@@ -48,7 +55,9 @@ class FileReaderRegistry:
     @classmethod
     def is_registered(cls, func: Callable) -> bool:
         """Check if function is registered"""
-        return func in cls._readers.values()
+        # O(1): look the function up under the name it was registered with
+        name = getattr(func, '_registered_name', None)
+        return name is not None and cls._readers.get(name) is func
 
     @classmethod
     def get_reader(cls, name: str) -> Callable:
@@ -62,11 +71,12 @@ class FileReaderRegistry:
     @classmethod
     def get_reader_by_extension(cls, extension: str) -> Optional[Callable]:
         """Get reader for a file extension"""
-        ext_lower = extension.lower()
-        if ext_lower in cls._extensions:
-            reader_name = cls._extensions[ext_lower]
-            return cls._readers[reader_name]
-        return None
+        # Keys are stored lower-cased; most callers already pass lower-case,
+        # so only pay for .lower() on a miss
+        reader = cls._extensions.get(extension)
+        if reader is None:
+            reader = cls._extensions.get(extension.lower())
+        return reader
 
     @classmethod
     def list_readers(cls) -> List[str]:
@@ -76,7 +86,7 @@ class FileReaderRegistry:
     @classmethod
     def list_extensions(cls) -> Dict[str, str]:
         """List all registered extensions and their readers"""
-        return dict(cls._extensions)
+        return {ext: func._registered_name for ext, func in cls._extensions.items()}
 
 
 # ============================================================================
@@ -85,8 +95,23 @@ class FileReaderRegistry:
 
 @FileReaderRegistry.register(extensions=['.csv', '.tsv'])
 def csv_reader(filepath: str, **kwargs) -> Any:
-    """Read CSV/TSV files using pandas"""
+    """
+    Read CSV/TSV files using pandas (multithreaded pyarrow engine when installed).
+
+    Note: the pyarrow engine infers some column types the default C engine
+    leaves as strings (e.g. ISO-8601 timestamps become datetime64). Pass
+    engine='c' for the same dtypes regardless of whether pyarrow is installed.
+    """
+    import importlib.util
     import pandas as pd
+    if 'engine' not in kwargs and importlib.util.find_spec('pyarrow') is not None:
+        try:
+            return pd.read_csv(filepath, engine='pyarrow', **kwargs)
+        except ValueError as e:
+            # Only retry for options pandas rejects for this engine; parse
+            # errors on malformed files propagate instead of being re-parsed
+            if "'pyarrow' engine" not in str(e):
+                raise
     return pd.read_csv(filepath, **kwargs)
 
 
@@ -121,25 +146,55 @@ def pickle_reader(filepath: str, **kwargs) -> Any:
 
 @FileReaderRegistry.register(extensions=['.json'])
 def json_reader(filepath: str, **kwargs) -> dict:
-    """Read JSON files"""
+    """Read JSON files (orjson when installed)"""
     import json
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson is strict (no NaN/Infinity, no ints beyond 64 bits);
+        # let the stdlib parser accept those or raise its usual error
+        return json.loads(data)
 
 
 @FileReaderRegistry.register(extensions=['.yaml', '.yml'])
 def yaml_reader(filepath: str, **kwargs) -> dict:
-    """Read YAML files"""
+    """Read YAML files (libyaml C loader when available)"""
     import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     with open(filepath, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
+
+
+# Files above this size are decoded straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
 
 
 @FileReaderRegistry.register(extensions=['.txt', '.log', '.md'])
 def text_reader(filepath: str, encoding: str = 'utf-8', **kwargs) -> str:
     """Read text files"""
-    with open(filepath, 'r', encoding=encoding) as f:
-        return f.read()
+    import io
+    import os
+    with open(filepath, 'rb') as f:
+        # encoding=None means the locale default, which only text mode resolves
+        if encoding is None or os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            return io.TextIOWrapper(f, encoding=encoding).read()
+
+        # Large file: decode from the page cache instead of first copying the
+        # whole file into a bytes object (halves peak memory)
+        import mmap
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, encoding)
+
+    # Same universal-newline handling as text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 @FileReaderRegistry.register(extensions=['.bin', '.dat'])
@@ -1,6 +1,20 @@
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
-from typing import List, Dict, Any
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Tuple, Union
+
+# LangChain is imported where it is used, so importing this module (e.g. just
+# for the analysis helpers) doesn't pay LangChain's import time
+if TYPE_CHECKING:
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    from langchain.schema import Document
+
+# RecursiveCharacterTextSplitter's own default hierarchy
+DEFAULT_SEPARATORS = ("\n\n", "\n", " ", "")
 
 
 def normalize_page_data(pages_data: List[Dict[str, str]]) -> List[Dict[str, Any]]:
@@ -14,153 +28,387 @@ def normalize_page_data(pages_data: List[Dict[str, str]]) -> List[Dict[str, Any]
     Returns:
         List of dicts with 'page' and 'content' keys
     """
-    normalized_data = []
+    # Each dictionary should have exactly one key-value pair;
+    # string page numbers are converted to int
+    return [
+        {"page": int(page_num), "content": content}
+        for page_dict in pages_data
+        for page_num, content in page_dict.items()
+    ]
+
+
+def normalize_page_data_tuples(pages_data: List[Dict[str, str]]) -> Tuple[List[int], List[str]]:
+    """
+    Convert page data from the page-number-keyed format to parallel lists.
+
+    Skips building one dict per page, for callers that only need the
+    page numbers and contents side by side.
+
+    Args:
+        pages_data: List of dicts where each dict has page number as key and content as value
+
+    Returns:
+        Tuple of (page numbers as ints, contents), in input order
+    """
+    pages = []
+    contents = []
 
     for page_dict in pages_data:
-        # Each dictionary should have exactly one key-value pair
         for page_num, content in page_dict.items():
-            normalized_data.append({
-                "page": int(page_num),  # Convert string page number to int
-                "content": content
-            })
+            pages.append(int(page_num))
+            contents.append(content)
 
-    return normalized_data
+    return pages, contents
 
 
-def chunk_text_with_page_metadata(
-        pages_data: List[Dict[str, Any]],
-        chunk_size: int = 1000,
-        chunk_overlap: int = 200
-) -> List[Document]:
+@lru_cache(maxsize=32)
+def _get_splitter(
+        chunk_size: int,
+        chunk_overlap: int,
+        separators: Tuple[str, ...]
+) -> RecursiveCharacterTextSplitter:
     """
-    Chunk text while preserving page metadata.
-
-    Args:
-        pages_data: List of dicts with 'page' and 'content' keys
-        chunk_size: Maximum size of each chunk
-        chunk_overlap: Number of characters to overlap between chunks
+    Return a shared splitter for these settings.
 
-    Returns:
-        List of Document objects with page metadata
+    Splitters hold no per-call state, so repeated calls with the same
+    settings reuse one instance. separators must be a tuple to be hashable.
     """
-    # Normalize data if needed
-    if pages_data and not all('page' in d and 'content' in d for d in pages_data):
-        pages_data = normalize_page_data(pages_data)
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
 
-    # Initialize the text splitter
-    text_splitter = RecursiveCharacterTextSplitter(
+    return RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
         length_function=len,
-        separators=["\n\n", "\n", " ", ""]
+        separators=list(separators)
     )
 
-    all_chunks = []
 
-    # Process each page
-    for page_data in pages_data:
-        page_num = page_data["page"]
-        content = page_data["content"]
+def _ensure_normalized(pages_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Return pages_data in the 'page'/'content' format, normalizing only if needed.
+
+    All entries share one format, so only the first dict is inspected.
+    """
+    if pages_data:
+        first = pages_data[0]
+        if 'page' not in first or 'content' not in first:
+            return normalize_page_data(pages_data)
+    return pages_data
+
+
+def _split_span(
+        text: str,
+        start: int,
+        end: int,
+        separators: Tuple[str, ...],
+        chunk_size: int,
+        chunk_overlap: int,
+        out: List[Tuple[str, int]]
+) -> None:
+    """Recursive step of _split_text_with_offsets for text[start:end]."""
+    # Use the first separator present in the span; "" splits into characters.
+    # Its first match is kept so cutting resumes from there, not from start.
+    separator = separators[-1]
+    new_separators = ()
+    pos = -1
+    for i, sep in enumerate(separators):
+        if sep == "":
+            separator = sep
+            break
+        pos = text.find(sep, start, end)
+        if pos != -1:
+            separator = sep
+            new_separators = separators[i + 1:]
+            break
+
+    # Cut before each separator occurrence, so it starts the next piece
+    if separator:
+        cuts = [start]
+        while pos != -1:
+            cuts.append(pos)
+            pos = text.find(separator, pos + len(separator), end)
+        cuts.append(end)
+        splits = [(a, b) for a, b in zip(cuts, cuts[1:]) if b > a]
+    elif chunk_size > 1:
+        # Every piece is a single character, so merging them just slides a
+        # fixed window; compute the windows instead of one span per character
+        if end > start:
+            _merge_char_windows(text, start, end, chunk_size, chunk_overlap, out)
+        return
+    else:
+        splits = [(i, i + 1) for i in range(start, end)]
+
+    # Merge small pieces, recursing into pieces that are still too long
+    good_splits = []
+    for a, b in splits:
+        if b - a < chunk_size:
+            good_splits.append((a, b))
+        else:
+            if good_splits:
+                _merge_spans(text, good_splits, chunk_size, chunk_overlap, out)
+                good_splits = []
+            if not new_separators:
+                out.append((text[a:b], a))
+            else:
+                _split_span(text, a, b, new_separators, chunk_size, chunk_overlap, out)
+    if good_splits:
+        _merge_spans(text, good_splits, chunk_size, chunk_overlap, out)
+
+
+def _merge_spans(
+        text: str,
+        spans: List[Tuple[int, int]],
+        chunk_size: int,
+        chunk_overlap: int,
+        out: List[Tuple[str, int]]
+) -> None:
+    """Combine adjacent spans into overlapping chunks of at most chunk_size."""
+    current = deque()
+    total = 0
+    for a, b in spans:
+        length = b - a
+        if total + length > chunk_size and current:
+            _emit_stripped(text, current[0][0], current[-1][1], out)
+            # Drop spans from the front until only the overlap is left
+            # and the next span fits
+            while total > chunk_overlap or (total + length > chunk_size and total > 0):
+                first_a, first_b = current.popleft()
+                total -= first_b - first_a
+        current.append((a, b))
+        total += length
+    if current:
+        _emit_stripped(text, current[0][0], current[-1][1], out)
+
+
+def _merge_char_windows(
+        text: str,
+        start: int,
+        end: int,
+        chunk_size: int,
+        chunk_overlap: int,
+        out: List[Tuple[str, int]]
+) -> None:
+    """_merge_spans for text[start:end] cut into single characters."""
+    # Each full window keeps min(chunk_overlap, chunk_size - 1) characters
+    # for the next one; the last window takes whatever is left
+    step = chunk_size - min(chunk_overlap, chunk_size - 1)
+    window_start = start
+    while window_start + chunk_size < end:
+        _emit_stripped(text, window_start, window_start + chunk_size, out)
+        window_start += step
+    _emit_stripped(text, window_start, end, out)
+
+
+def _emit_stripped(text: str, start: int, end: int, out: List[Tuple[str, int]]) -> None:
+    """Append text[start:end] stripped of whitespace, with its offset, unless empty."""
+    chunk = text[start:end]
+    stripped = chunk.strip()
+    if stripped:
+        out.append((stripped, start + len(chunk) - len(chunk.lstrip())))
+
+
+def _split_text_with_offsets(
+        text: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        separators: Tuple[str, ...] = DEFAULT_SEPARATORS
+) -> List[Tuple[str, int]]:
+    """
+    Split text the way RecursiveCharacterTextSplitter does (literal separators,
+    kept at the start of each piece, chunks stripped, length_function=len) and
+    return each chunk together with its start offset in text.
 
-        # Create a Document object for the page
-        page_document = Document(
-            page_content=content,
-            metadata={"page": page_num}
+    Works on (start, end) spans instead of substrings, so every chunk's
+    position is known when it is cut rather than searched for afterwards,
+    which also keeps repeated text from being mapped to the wrong place.
+    """
+    if chunk_overlap > chunk_size:
+        raise ValueError(
+            f"Got a larger chunk overlap ({chunk_overlap}) than chunk size "
+            f"({chunk_size}), should be smaller."
         )
+    chunks = []
+    _split_span(text, 0, len(text), separators, chunk_size, chunk_overlap, chunks)
+    return chunks
 
-        # Split the page content into chunks
-        page_chunks = text_splitter.split_documents([page_document])
 
-        # Add chunk index within the page for better tracking
-        for i, chunk in enumerate(page_chunks):
-            chunk.metadata.update({
-                "page": page_num,
-                "chunk_index": i,
-                "source_page": page_num  # Alternative key name
-            })
+def _overlapping_page_ranges(
+        starts: List[int],
+        ends: List[int],
+        chunk_starts: List[int],
+        chunk_ends: List[int]
+) -> Tuple[List[int], List[int]]:
+    """
+    For each chunk [start, end), return the index range [first, last) of the
+    pages it overlaps. Page starts and ends must be sorted, as built by the
+    chunkers. Uses one vectorized NumPy searchsorted per side when NumPy is
+    installed, bisect per chunk otherwise.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return (
+            [bisect_right(ends, start) for start in chunk_starts],
+            [bisect_left(starts, end) for end in chunk_ends],
+        )
+    first = np.searchsorted(np.asarray(ends), chunk_starts, side="right")
+    last = np.searchsorted(np.asarray(starts), chunk_ends, side="left")
+    return first.tolist(), last.tolist()
 
-        all_chunks.extend(page_chunks)
 
-    return all_chunks
+def _split_one(content: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """Split one page's text; module-level so worker processes can run it."""
+    return _get_splitter(chunk_size, chunk_overlap, DEFAULT_SEPARATORS).split_text(content)
 
 
-def chunk_all_content_with_page_tracking(
+def iter_chunk_text_with_page_metadata(
         pages_data: List[Dict[str, Any]],
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
-        page_separator: str = "\n\n"
+        max_workers: Optional[int] = None
+) -> Iterator[Document]:
+    """
+    Like chunk_text_with_page_metadata, but yields each Document as it is built,
+    so callers can stream chunks into embedding or indexing.
+    """
+    from langchain.schema import Document
+
+    # Normalize data if needed
+    pages_data = _ensure_normalized(pages_data)
+
+    page_nums = [page_data["page"] for page_data in pages_data]
+    contents = [page_data["content"] for page_data in pages_data]
+    sizes = repeat(chunk_size, len(contents))
+    overlaps = repeat(chunk_overlap, len(contents))
+
+    # Pages are independent, so they can be split concurrently; map keeps page order
+    if max_workers is not None and max_workers > 1 and len(contents) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            page_texts = list(pool.map(_split_one, contents, sizes, overlaps,
+                                       chunksize=max(1, len(contents) // (max_workers * 4))))
+    else:
+        page_texts = map(_split_one, contents, sizes, overlaps)
+
+    # Process each page
+    for page_num, texts in zip(page_nums, page_texts):
+        # Build the chunk Documents with their final metadata,
+        # skipping the per-page wrapper Document
+        for i, text in enumerate(texts):
+            yield Document(
+                page_content=text,
+                metadata={
+                    "page": page_num,
+                    "chunk_index": i,  # Chunk index within the page for better tracking
+                    "source_page": page_num  # Alternative key name
+                }
+            )
+
+
+def chunk_text_with_page_metadata(
+        pages_data: List[Dict[str, Any]],
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        max_workers: Optional[int] = None
 ) -> List[Document]:
     """
-    Best approach: Combine all content for optimal chunking while tracking page metadata.
-    This gives RecursiveCharacterTextSplitter full control over split points.
+    Chunk text while preserving page metadata.
+
+    Args:
+        pages_data: List of dicts with 'page' and 'content' keys
+        chunk_size: Maximum size of each chunk
+        chunk_overlap: Number of characters to overlap between chunks
+        max_workers: Split pages in this many worker processes; None or 1
+            splits in the current process, which is faster for short documents
+
+    Returns:
+        List of Document objects with page metadata
+    """
+    return list(iter_chunk_text_with_page_metadata(pages_data, chunk_size, chunk_overlap, max_workers))
+
+
+def iter_chunk_all_content_with_page_tracking(
+        pages_data: List[Dict[str, Any]],
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        page_separator: str = "\n\n"
+) -> Iterator[Document]:
     """
+    Like chunk_all_content_with_page_tracking, but yields each Document as it is built,
+    so callers can stream chunks into embedding or indexing.
+    """
+    from langchain.schema import Document
+
     # Normalize data if needed
-    if pages_data and not all('page' in d and 'content' in d for d in pages_data):
-        pages_data = normalize_page_data(pages_data)
+    pages_data = _ensure_normalized(pages_data)
 
-    # Step 1: Build the complete text and track page boundaries
-    full_text = ""
-    page_map = []  # Maps character positions to page numbers
+    # Step 1: Build the complete text and track page boundaries.
+    # Pieces are joined once at the end; offsets come from a running length.
+    parts = []
+    offset = 0
+    # Parallel (start, end, page) arrays of each non-empty page, in text order
+    starts = []
+    ends = []
+    pages = []
 
     for i, page_data in enumerate(pages_data):
         content = page_data["content"]
         page_num = page_data["page"]
 
         # Record the start position for this page
-        start_pos = len(full_text)
+        start_pos = offset
 
         # Add the content
-        full_text += content
+        parts.append(content)
+        offset += len(content)
 
         # Record the end position for this page
-        end_pos = len(full_text)
+        end_pos = offset
 
-        # Map each character position to its page number
-        for pos in range(start_pos, end_pos):
-            if pos >= len(page_map):
-                page_map.extend([None] * (pos - len(page_map) + 1))
-            page_map[pos] = page_num
+        # Empty pages own no characters, so no chunk can belong to them
+        if end_pos > start_pos:
+            starts.append(start_pos)
+            ends.append(end_pos)
+            pages.append(page_num)
 
-        # Add separator between pages (except last page)
+        # Add separator between pages (except last page);
+        # separator characters fall between boundaries and belong to no page
         if i < len(pages_data) - 1:
-            full_text += page_separator
-            # Map separator characters to None (they don't belong to any page)
-            separator_start = len(full_text) - len(page_separator)
-            for pos in range(separator_start, len(full_text)):
-                if pos >= len(page_map):
-                    page_map.extend([None] * (pos - len(page_map) + 1))
-                page_map[pos] = None
-
-    # Step 2: Let RecursiveCharacterTextSplitter do its magic
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        length_function=len,
-        separators=["\n\n", "\n", ". ", " ", ""]  # Standard hierarchy
-    )
+            parts.append(page_separator)
+            offset += len(page_separator)
 
-    chunks = text_splitter.split_text(full_text)
+    full_text = "".join(parts)
+    # Small non-negative int page numbers can be collected as bits of an int,
+    # which comes out deduplicated and sorted without a set or sort
+    use_bitmap = all(type(page_num) is int and 0 <= page_num < 65536 for page_num in pages)
 
-    # Step 3: Map each chunk back to its source pages
-    documents = []
-    search_start = 0
+    # Step 2: Split like RecursiveCharacterTextSplitter, keeping each chunk's offset
+    chunks = _split_text_with_offsets(
+        full_text, chunk_size, chunk_overlap, ("\n\n", "\n", ". ", " ", "")  # Standard hierarchy
+    )
 
-    for chunk_idx, chunk_text in enumerate(chunks):
-        # Find where this chunk appears in the full text
-        chunk_start = full_text.find(chunk_text, search_start)
-        if chunk_start == -1:
-            # Fallback: search from beginning
-            chunk_start = full_text.find(chunk_text)
+    # Step 3: Map each chunk back to its source pages, resolving every
+    # chunk's page index range in one batch
+    chunk_starts = [start for _, start in chunks]
+    chunk_ends = [start + len(text) for text, start in chunks]
+    first_pages, last_pages = _overlapping_page_ranges(starts, ends, chunk_starts, chunk_ends)
 
-        chunk_end = chunk_start + len(chunk_text)
+    for chunk_idx, (chunk_text, chunk_start) in enumerate(chunks):
+        chunk_end = chunk_ends[chunk_idx]
 
         # Determine which pages this chunk spans
-        pages_in_chunk = set()
-        for pos in range(chunk_start, min(chunk_end, len(page_map))):
-            if page_map[pos] is not None:
-                pages_in_chunk.add(page_map[pos])
-
-        pages_list = sorted(list(pages_in_chunk))
+        pages_in_chunk = pages[first_pages[chunk_idx]:last_pages[chunk_idx]]
+
+        if use_bitmap:
+            mask = 0
+            for page_num in pages_in_chunk:
+                mask |= 1 << page_num
+            pages_list = []
+            while mask:
+                low_bit = mask & -mask
+                pages_list.append(low_bit.bit_length() - 1)
+                mask ^= low_bit
+        else:
+            pages_list = sorted(set(pages_in_chunk))
 
         # Create comprehensive metadata
         metadata = {
@@ -177,84 +425,78 @@ def chunk_all_content_with_page_tracking(
         if len(pages_list) == 1:
             metadata["page"] = pages_list[0]
 
-        documents.append(Document(
+        yield Document(
             page_content=chunk_text,
             metadata=metadata
-        ))
+        )
 
-        # Update search position for next chunk
-        search_start = chunk_start + 1
 
-    return documents
+def chunk_all_content_with_page_tracking(
+        pages_data: List[Dict[str, Any]],
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        page_separator: str = "\n\n"
+) -> List[Document]:
+    """
+    Best approach: Combine all content for optimal chunking while tracking page metadata.
+    This gives RecursiveCharacterTextSplitter full control over split points.
+    """
+    return list(iter_chunk_all_content_with_page_tracking(pages_data, chunk_size, chunk_overlap, page_separator))
 
 
-def chunk_all_content_optimized(
+def iter_chunk_all_content_optimized(
         pages_data: List[Dict[str, Any]],
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
         preserve_page_breaks: bool = True
-) -> List[Document]:
+) -> Iterator[Document]:
     """
-    Memory-optimized version for large documents.
-    Uses page boundaries instead of character-level mapping.
+    Like chunk_all_content_optimized, but yields each Document as it is built,
+    so callers can stream chunks into embedding or indexing.
     """
+    from langchain.schema import Document
+
     # Normalize data if needed
-    if pages_data and not all('page' in d and 'content' in d for d in pages_data):
-        pages_data = normalize_page_data(pages_data)
+    pages_data = _ensure_normalized(pages_data)
 
-    # Build page boundaries
-    page_boundaries = []
-    full_text = ""
+    # Build page boundaries as parallel arrays (both sorted by construction)
+    starts = []
+    ends = []
+    pages = []
+    parts = []
+    offset = 0
+    separator = "\n\n" if preserve_page_breaks else " "  # Preserve page breaks or minimal separation
 
     for i, page_data in enumerate(pages_data):
         content = page_data["content"]
         page_num = page_data["page"]
 
-        start_pos = len(full_text)
-        full_text += content
-        end_pos = len(full_text)
+        start_pos = offset
+        parts.append(content)
+        offset += len(content)
+        end_pos = offset
 
-        page_boundaries.append({
-            "page": page_num,
-            "start": start_pos,
-            "end": end_pos,
-            "content": content
-        })
+        starts.append(start_pos)
+        ends.append(end_pos)
+        pages.append(page_num)
 
         # Add page separator
         if i < len(pages_data) - 1:
-            if preserve_page_breaks:
-                full_text += "\n\n"  # Preserve page breaks
-            else:
-                full_text += " "  # Minimal separation
+            parts.append(separator)
+            offset += len(separator)
 
-    # Chunk the full text
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        length_function=len
-    )
+    full_text = "".join(parts)
 
-    chunks = text_splitter.split_text(full_text)
+    # Chunk the full text; offsets come straight from the split
+    chunks = _split_text_with_offsets(full_text, chunk_size, chunk_overlap)
+    chunk_starts = [start for _, start in chunks]
 
-    # Map chunks to pages efficiently
-    documents = []
-    search_pos = 0
+    chunk_ends = [start + len(text) for text, start in chunks]
+    first_pages, last_pages = _overlapping_page_ranges(starts, ends, chunk_starts, chunk_ends)
 
-    for chunk_idx, chunk_text in enumerate(chunks):
-        # Find chunk position
-        chunk_start = full_text.find(chunk_text, search_pos)
-        if chunk_start == -1:
-            chunk_start = full_text.find(chunk_text)
-
-        chunk_end = chunk_start + len(chunk_text)
-
-        # Find overlapping pages
-        overlapping_pages = []
-        for boundary in page_boundaries:
-            # Check if chunk overlaps with this page
-            if (chunk_start < boundary["end"] and chunk_end > boundary["start"]):
-                overlapping_pages.append(boundary["page"])
+    for chunk_idx, (chunk_text, chunk_start) in enumerate(chunks):
+        # Pages ending after chunk_start and starting before chunk_end
+        overlapping_pages = pages[first_pages[chunk_idx]:last_pages[chunk_idx]]
 
         # Create metadata
         metadata = {
@@ -263,24 +505,111 @@ def chunk_all_content_optimized(
             "primary_page": overlapping_pages[0] if overlapping_pages else None,
             "spans_multiple_pages": len(overlapping_pages) > 1,
             "char_start": chunk_start,
-            "char_end": chunk_end
+            "char_end": chunk_ends[chunk_idx]
         }
 
         if len(overlapping_pages) == 1:
             metadata["page"] = overlapping_pages[0]
 
-        documents.append(Document(
+        yield Document(
             page_content=chunk_text,
             metadata=metadata
-        ))
+        )
 
-        search_pos = chunk_start + 1
 
-    return documents
+def chunk_all_content_optimized(
+        pages_data: List[Dict[str, Any]],
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        preserve_page_breaks: bool = True
+) -> List[Document]:
+    """
+    Memory-optimized version for large documents.
+    Uses page boundaries instead of character-level mapping.
+    """
+    return list(iter_chunk_all_content_optimized(pages_data, chunk_size, chunk_overlap, preserve_page_breaks))
 
 
-# Example usage
-if __name__ == "__main__":
+# Utility functions for analysis
+def analyze_chunking_results(chunks: List[Document]) -> Dict[str, Any]:
+    """Analyze the chunking results for insights."""
+    total_chunks = len(chunks)
+
+    # Single pass over the chunks; pages are counted in one Counter call after
+    single_page_chunks = 0
+    total_length = 0
+    page_lists = []
+    for chunk in chunks:
+        metadata = chunk.metadata
+        if not metadata.get('spans_multiple_pages', False):
+            single_page_chunks += 1
+        total_length += len(chunk.page_content)
+        page_lists.append(metadata.get('pages', ()))
+
+    multi_page_chunks = total_chunks - single_page_chunks
+    page_distribution = Counter(chain.from_iterable(page_lists))
+
+    return {
+        "total_chunks": total_chunks,
+        "single_page_chunks": single_page_chunks,
+        "multi_page_chunks": multi_page_chunks,
+        "page_distribution": dict(page_distribution),
+        "avg_chunk_length": total_length / total_chunks if chunks else 0
+    }
+
+
+# Additional utility functions
+def build_page_index(chunks: List[Document]) -> Dict[int, List[Document]]:
+    """
+    Map each page number to the chunks that belong to it, in chunk order.
+
+    Build once and pass to filter_chunks_by_page to look pages up
+    repeatedly without rescanning every chunk.
+    """
+    index = defaultdict(list)
+    for chunk in chunks:
+        metadata = chunk.metadata
+        pages = metadata.get("pages", ())
+        for page in pages:
+            index[page].append(chunk)
+        page = metadata.get("page")
+        if page is not None and page not in pages:
+            index[page].append(chunk)
+    return dict(index)
+
+
+def filter_chunks_by_page(
+        chunks: Union[List[Document], Dict[int, List[Document]]],
+        page_number: int
+) -> List[Document]:
+    """
+    Filter chunks that belong to a specific page.
+
+    chunks may also be an index from build_page_index, which answers in
+    O(1) instead of scanning the list.
+    """
+    if isinstance(chunks, dict):
+        return list(chunks.get(page_number, ()))
+    return [
+        chunk for chunk in chunks
+        if chunk.metadata.get("page") == page_number or
+           page_number in chunk.metadata.get("pages", [])
+    ]
+
+
+def get_chunk_page_info(chunk: Document) -> Dict[str, Any]:
+    """Extract page information from a chunk."""
+    metadata = chunk.metadata
+    return {
+        "single_page": metadata.get("page"),
+        "multiple_pages": metadata.get("pages"),
+        "primary_page": metadata.get("primary_page"),
+        "spans_multiple": metadata.get("spans_multiple_pages", False)
+    }
+
+
+def _demo():
+    """Example usage"""
     # Your sample data format
     sample_pages = [
         {
@@ -323,44 +652,5 @@ if __name__ == "__main__":
             print(chunk.metadata)
 
 
-# Utility functions for analysis
-def analyze_chunking_results(chunks: List[Document]) -> Dict[str, Any]:
-    """Analyze the chunking results for insights."""
-    total_chunks = len(chunks)
-    single_page_chunks = sum(1 for c in chunks if not c.metadata.get('spans_multiple_pages', False))
-    multi_page_chunks = total_chunks - single_page_chunks
-
-    page_distribution = {}
-    for chunk in chunks:
-        pages = chunk.metadata.get('pages', [])
-        for page in pages:
-            page_distribution[page] = page_distribution.get(page, 0) + 1
-
-    return {
-        "total_chunks": total_chunks,
-        "single_page_chunks": single_page_chunks,
-        "multi_page_chunks": multi_page_chunks,
-        "page_distribution": page_distribution,
-        "avg_chunk_length": sum(len(c.page_content) for c in chunks) / total_chunks if chunks else 0
-    }
-
-
-# Additional utility functions
-def filter_chunks_by_page(chunks: List[Document], page_number: int) -> List[Document]:
-    """Filter chunks that belong to a specific page."""
-    return [
-        chunk for chunk in chunks
-        if chunk.metadata.get("page") == page_number or
-           page_number in chunk.metadata.get("pages", [])
-    ]
-
-
-def get_chunk_page_info(chunk: Document) -> Dict[str, Any]:
-    """Extract page information from a chunk."""
-    metadata = chunk.metadata
-    return {
-        "single_page": metadata.get("page"),
-        "multiple_pages": metadata.get("pages"),
-        "primary_page": metadata.get("primary_page"),
-        "spans_multiple": metadata.get("spans_multiple_pages", False)
-    }
\ No newline at end of file
+if __name__ == "__main__":
+    _demo()